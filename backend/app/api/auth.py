@@ -45,10 +45,12 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         role=user.role
     )
     db.add(db_user)
+    
+    db.flush()
+    user_response = UserResponse.model_validate(db_user)
     db.commit()
-    db.refresh(db_user)
     
-    return db_user
+    return user_response
 
 
 @router.post("/login", response_model=Token)
@@ -26,10 +26,12 @@ def create_job(
     )
     
     db.add(db_job)
+    
+    db.flush()
+    job_response = JobResponse.model_validate(db_job)
     db.commit()
-    db.refresh(db_job)
     
-    return db_job
+    return job_response
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
@@ -1,97 +1,165 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Query, Response
+from sqlalchemy import insert, tuple_
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from datetime import datetime
+import base64
+import binascii
 import zipfile
 import io
-from ..database import get_db
+import logging
+from ..database import SessionManager, get_db
 from ..models.models import Resume, User
 from ..schemas.schemas import ResumeResponse, ResumeSearchResponse, AskQuery, AskResponse
 from ..services.resume_service import resume_service
 from .auth import get_current_user
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-@router.post("/resumes", response_model=List[ResumeResponse])
-def upload_resumes(
-    files: List[UploadFile] = File(...),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Upload one or more resume files."""
-    if not files:
+def _encode_cursor(resume: Resume) -> str:
+    """Encode the keyset position of a resume as an opaque cursor."""
+    raw = f"{resume.created_at.isoformat()}|{resume.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        created_at, resume_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(resume_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No files provided"
+            detail="Invalid cursor"
         )
-    
-    processed_resumes = []
-    
+
+
+def _iter_resume_files(files: List[UploadFile]) -> Iterator[Tuple[str, bytes]]:
+    """Yield (filename, content) for each uploaded resume, expanding ZIP files lazily."""
     for file in files:
         if not file.filename:
             continue
-            
-        # Read file content
-        file_content = file.file.read()
         
         try:
             if file.filename.lower().endswith('.zip'):
-                # Process ZIP file
-                zip_results = resume_service.process_zip_file(file_content)
-                for filename, content_text, pii_redacted_content, embedding in zip_results:
-                    resume = Resume(
-                        filename=filename,
-                        content_text=content_text,
-                        pii_redacted_content=pii_redacted_content,
-                        embedding=embedding,
-                        owner_id=current_user.id
-                    )
-                    db.add(resume)
-                    processed_resumes.append(resume)
+                # Read ZIP members straight from the spooled upload, one at a time
+                yield from resume_service.iter_zip_file(file.file)
             else:
                 # Process single file
-                content_text, pii_redacted_content, embedding = resume_service.process_resume_file(
-                    file.filename, file_content
-                )
-                resume = Resume(
-                    filename=file.filename,
-                    content_text=content_text,
-                    pii_redacted_content=pii_redacted_content,
-                    embedding=embedding,
-                    owner_id=current_user.id
-                )
-                db.add(resume)
-                processed_resumes.append(resume)
+                yield file.filename, file.file.read()
                 
         except Exception as e:
-            # Skip files that can't be processed
+            # Skip files that can't be processed, e.g. a ZIP that can't be opened
             continue
+
+
+def embed_pending_resumes() -> None:
+    """Embed resumes stored without an embedding; runs after uploads and periodically."""
+    try:
+        with SessionManager() as db:
+            resume_service.embed_pending_resumes(db)
+    except Exception:
+        # Rows stay NULL and are picked up by the next sweep
+        logger.exception("Embedding backfill failed")
+
+
+@router.post("/resumes", response_model=List[ResumeResponse])
+def upload_resumes(
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Upload one or more resume files."""
+    if not files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No files provided"
+        )
+    
+    # Stream every resume (including ZIP members) through parallel extraction
+    extracted = resume_service.extract_and_redact_many(_iter_resume_files(files))
+    
+    # Embeddings are filled in by a background task after the response is sent
+    resume_rows = [
+        {
+            "filename": filename,
+            "content_text": content_text,
+            "pii_redacted_content": pii_redacted_content,
+            "embedding": None,
+            "owner_id": current_user.id
+        }
+        for filename, content_text, pii_redacted_content in extracted
+    ]
+    
+    if not resume_rows:
+        return []
+    
+    # Insert all resumes in one statement and get generated columns back via RETURNING
+    result = db.execute(
+        insert(Resume).returning(Resume.id, Resume.created_at, sort_by_parameter_order=True),
+        resume_rows
+    )
+    processed_resumes = [
+        ResumeResponse(
+            id=inserted.id,
+            filename=row["filename"],
+            content_text=row["content_text"],
+            pii_redacted_content=row["pii_redacted_content"],
+            owner_id=row["owner_id"],
+            created_at=inserted.created_at
+        )
+        for row, inserted in zip(resume_rows, result)
+    ]
     
     db.commit()
     
-    # Refresh all resumes to get their IDs
-    for resume in processed_resumes:
-        db.refresh(resume)
+    background_tasks.add_task(embed_pending_resumes)
     
     return processed_resumes
 
 
 @router.get("/resumes", response_model=List[ResumeSearchResponse])
 def get_resumes(
+    response: Response,
     q: Optional[str] = Query(None, description="Search query"),
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    offset: Optional[int] = Query(None, ge=0, description="Deprecated: use cursor"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get resumes with optional search."""
+    """Get resumes with optional search, newest first, using keyset pagination."""
     query = db.query(Resume)
     
     if q:
         # Simple text search in redacted content
         query = query.filter(Resume.pii_redacted_content.ilike(f"%{q}%"))
     
-    resumes = query.offset(offset).limit(limit).all()
+    if cursor and offset is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both"
+        )
+    
+    query = query.order_by(Resume.created_at.desc(), Resume.id.desc())
+    
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(tuple_(Resume.created_at, Resume.id) < (cursor_created_at, cursor_id))
+    elif offset:
+        # Older clients still page by offset
+        query = query.offset(offset)
+    
+    # Fetch one extra row to know whether another page exists
+    resumes = query.limit(limit + 1).all()
+    
+    if len(resumes) > limit:
+        resumes = resumes[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(resumes[-1])
+    
     return resumes
 
 
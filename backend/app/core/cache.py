@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import List, Optional
+import numpy as np
+import redis
+from .config import settings
+
+# Shared Redis client for caching, idempotency and rate limiting
+try:
+    redis_client = redis.from_url(settings.redis_url)
+    redis_client.ping()
+except:
+    redis_client = None
+
+
+class SemanticQueryCache:
+    """In-process cache returning stored search results for semantically similar queries.
+    
+    With a Redis client, clear() bumps a shared generation counter so every
+    worker process drops its entries, not just the one that cleared.
+    """
+    
+    GENERATION_KEY = "semantic_cache:generation"
+    
+    def __init__(
+        self,
+        dimension: int,
+        threshold: float = 0.95,
+        ttl_seconds: int = 3600,
+        max_entries: int = 10000,
+        redis_client=None
+    ):
+        self.redis_client = redis_client
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        
+        # Preallocated rows of L2-normalized query embeddings; expires_at == 0 marks a free slot
+        self._embeddings = np.zeros((max_entries, dimension), dtype=np.float32)
+        self._top_k = np.zeros(max_entries, dtype=np.int64)
+        self._expires_at = np.zeros(max_entries, dtype=np.float64)
+        self._last_used = np.zeros(max_entries, dtype=np.float64)
+        self._results: List[Optional[List[dict]]] = [None] * max_entries
+        self._size = 0
+        self._lock = threading.Lock()
+        self._generation = self._remote_generation()
+    
+    def get(self, embedding: np.ndarray, k: int) -> Optional[List[dict]]:
+        """Return cached results for a query within the similarity threshold, if any."""
+        now = time.monotonic()
+        generation = self._remote_generation()
+        
+        with self._lock:
+            if not self._sync_generation(generation) or self._size == 0:
+                return None
+            
+            valid = (self._expires_at[:self._size] > now) & (self._top_k[:self._size] == k)
+            if not valid.any():
+                return None
+            
+            # Dot product of normalized vectors is cosine similarity
+            scores = np.where(valid, self._embeddings[:self._size] @ embedding, -np.inf)
+            best = int(np.argmax(scores))
+            if scores[best] <= self.threshold:
+                return None
+            
+            self._last_used[best] = now
+            return self._results[best]
+    
+    def put(self, embedding: np.ndarray, k: int, results: List[dict]) -> None:
+        """Store results for a query, evicting the least recently used entry when full."""
+        now = time.monotonic()
+        generation = self._remote_generation()
+        
+        with self._lock:
+            if not self._sync_generation(generation):
+                # Cleared elsewhere since the lookup; results may predate new resumes
+                return
+            
+            free = np.flatnonzero(self._expires_at[:self._size] <= now)
+            if free.size:
+                slot = int(free[0])
+            elif self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+            
+            self._embeddings[slot] = embedding
+            self._top_k[slot] = k
+            self._expires_at[slot] = now + self.ttl_seconds
+            self._last_used[slot] = now
+            self._results[slot] = results
+    
+    def clear(self) -> None:
+        """Drop every cached entry, e.g. after new resumes are stored, in every process."""
+        generation = None
+        if self.redis_client:
+            try:
+                generation = int(self.redis_client.incr(self.GENERATION_KEY))
+            except:
+                pass
+        
+        with self._lock:
+            if generation is not None:
+                self._generation = generation
+            self._clear_entries()
+    
+    def _remote_generation(self) -> Optional[int]:
+        """Read the shared generation counter; None if Redis is unavailable."""
+        if not self.redis_client:
+            return None
+        
+        try:
+            return int(self.redis_client.get(self.GENERATION_KEY) or 0)
+        except:
+            return None
+    
+    def _sync_generation(self, generation: Optional[int]) -> bool:
+        """Drop local entries if another process cleared the cache; return whether they were current."""
+        if generation is None or generation == self._generation:
+            return True
+        
+        self._generation = generation
+        self._clear_entries()
+        return False
+    
+    def _clear_entries(self) -> None:
+        self._expires_at[:] = 0
+        self._results = [None] * self.max_entries
+        self._size = 0
@@ -0,0 +1,90 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Deque
+from starlette.concurrency import run_in_threadpool
+
+
+class SlidingWindowRateLimiter:
+    """Sliding-window rate limiter backed by a Redis sorted set per user.
+    
+    Falls back to an in-process deque of timestamps per user when Redis is
+    not available; that store keeps at most max_local_users users and evicts
+    the least recently seen one beyond that.
+    """
+    
+    def __init__(
+        self,
+        redis_client,
+        limit: int = 60,
+        window_seconds: int = 60,
+        max_local_users: int = 100_000
+    ):
+        self.redis_client = redis_client
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_local_users = max_local_users
+        self._local_windows: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._local_lock = threading.Lock()
+    
+    async def allow_async(self, user_id: str) -> bool:
+        """allow() for the event loop; the blocking Redis round trip runs in the threadpool."""
+        if self.redis_client:
+            return await run_in_threadpool(self.allow, user_id)
+        return self.allow(user_id)
+    
+    def allow(self, user_id: str) -> bool:
+        """Record a request for user_id and return whether it is within the limit."""
+        now = time.time()
+        
+        if self.redis_client:
+            try:
+                return self._allow_redis(user_id, now)
+            except:
+                pass
+        
+        return self._allow_local(user_id, now)
+    
+    def _allow_redis(self, user_id: str, now: float) -> bool:
+        """Trim, record and count the user's window in a single MULTI/EXEC."""
+        key = f"rl:{user_id}"
+        member = f"{now}:{uuid.uuid4().hex}"
+        
+        pipeline = self.redis_client.pipeline(transaction=True)
+        pipeline.zremrangebyscore(key, 0, now - self.window_seconds)
+        pipeline.zadd(key, {member: now})
+        pipeline.zcard(key)
+        pipeline.expire(key, self.window_seconds)
+        _, _, request_count, _ = pipeline.execute()
+        
+        if request_count > self.limit:
+            # Rejected requests don't count against the window
+            self.redis_client.zrem(key, member)
+            return False
+        
+        return True
+    
+    def _allow_local(self, user_id: str, now: float) -> bool:
+        """In-process fallback; locked because Redis failures land here from threadpool threads."""
+        with self._local_lock:
+            return self._allow_local_locked(user_id, now)
+    
+    def _allow_local_locked(self, user_id: str, now: float) -> bool:
+        """Drop expired timestamps from the front of the user's deque, then count."""
+        timestamps = self._local_windows.get(user_id)
+        if timestamps is None:
+            timestamps = self._local_windows[user_id] = deque()
+            if len(self._local_windows) > self.max_local_users:
+                self._local_windows.popitem(last=False)
+        else:
+            self._local_windows.move_to_end(user_id)
+        
+        while timestamps and now - timestamps[0] >= self.window_seconds:
+            timestamps.popleft()
+        
+        if len(timestamps) >= self.limit:
+            return False
+        
+        timestamps.append(now)
+        return True
@@ -1,10 +1,16 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from .core.config import settings
 
-# Create database engine
-engine = create_engine(settings.database_url)
+# Create database engine; pool_pre_ping drops connections the server has closed
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=True
+)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -13,10 +19,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+class SessionManager:
+    """Context manager that opens a session and always closes it."""
+    
+    def __enter__(self) -> Session:
+        self.db = SessionLocal()
+        return self.db
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # close() also rolls back anything left uncommitted
+        self.db.close()
+
+
 def get_db():
     """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+    with SessionManager() as db:
         yield db
-    finally:
-        db.close()
@@ -1,14 +1,20 @@
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
-import time
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+import asyncio
+import io
 import hashlib
-import json
-from typing import Dict, Any
-import redis
+import threading
+import orjson
+from cachetools import TTLCache
+from .core.cache import redis_client
 from .core.config import settings
+from .core.rate_limit import SlidingWindowRateLimiter
 from .database import engine
 from .models.models import Base
 from .api import auth, resumes, jobs
@@ -16,20 +22,42 @@ from .api import auth, resumes, jobs
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
-# Initialize Redis for idempotency
-try:
-    redis_client = redis.from_url(settings.redis_url)
-    redis_client.ping()
-except:
-    redis_client = None
+# In-memory storage for idempotency if Redis is not available; bounded and
+# expiring like the Redis keys. Written from background-task threads, so guarded.
+idempotency_cache = TTLCache(maxsize=10_000, ttl=3600)
+idempotency_cache_lock = threading.Lock()
 
-# In-memory storage for idempotency if Redis is not available
-idempotency_cache: Dict[str, Dict[str, Any]] = {}
+# Rate limiting - 60 requests per minute per user
+rate_limiter = SlidingWindowRateLimiter(redis_client, limit=60, window_seconds=60)
 
-# Rate limiting storage
-rate_limit_storage: Dict[str, Dict[str, Any]] = {}
 
-app = FastAPI(title="ResumeRAG API", version="1.0.0")
+async def run_embedding_backfill():
+    """Embed resumes left without an embedding, e.g. after a restart or a failed upload task."""
+    while True:
+        await run_in_threadpool(resumes.embed_pending_resumes)
+        await asyncio.sleep(settings.embedding_backfill_interval_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the embedding backfill sweep for the lifetime of the app."""
+    backfill_task = None
+    if settings.embedding_backfill_interval_seconds > 0:
+        backfill_task = asyncio.create_task(run_embedding_backfill())
+    
+    yield
+    
+    if backfill_task:
+        backfill_task.cancel()
+
+
+# orjson serializes straight to bytes, much faster than the stdlib json encoder
+app = FastAPI(
+    title="ResumeRAG API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # CORS middleware
 app.add_middleware(
@@ -38,6 +66,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include API routers
@@ -52,30 +81,12 @@ async def rate_limiting_middleware(request: Request, call_next):
     # Get user identifier (IP address for now, could be user ID if authenticated)
     user_id = request.client.host
     
-    current_time = time.time()
-    minute_window = 60
-    
-    # Clean old entries
-    if user_id in rate_limit_storage:
-        rate_limit_storage[user_id] = {
-            k: v for k, v in rate_limit_storage[user_id].items()
-            if current_time - v < minute_window
-        }
-    else:
-        rate_limit_storage[user_id] = {}
-    
-    # Count requests in current window
-    request_count = len(rate_limit_storage[user_id])
-    
-    if request_count >= 60:
-        return JSONResponse(
+    if not await rate_limiter.allow_async(user_id):
+        return ORJSONResponse(
             status_code=429,
             content={"error": {"code": "RATE_LIMIT"}}
         )
     
-    # Add current request
-    rate_limit_storage[user_id][str(current_time)] = current_time
-    
     response = await call_next(request)
     return response
 
@@ -97,56 +108,81 @@ async def idempotency_middleware(request: Request, call_next):
     cached_response = None
     if redis_client:
         try:
-            cached_data = redis_client.get(cache_key)
+            cached_data = redis_client.hgetall(cache_key)
             if cached_data:
-                cached_response = json.loads(cached_data)
+                cached_response = {
+                    "status_code": int(cached_data[b"status_code"]),
+                    "headers": cached_data[b"headers"],
+                    "body": cached_data[b"body"]
+                }
         except:
             pass
     
-    if not cached_response and cache_key in idempotency_cache:
-        cached_response = idempotency_cache[cache_key]
+    if not cached_response:
+        with idempotency_cache_lock:
+            cached_response = idempotency_cache.get(cache_key)
     
     if cached_response:
-        return JSONResponse(
-            status_code=cached_response["status_code"],
-            content=cached_response["content"],
-            headers=cached_response.get("headers", {})
-        )
+        # Replay the stored status, headers and bytes as-is
+        replayed = Response(content=cached_response["body"], status_code=cached_response["status_code"])
+        replayed.raw_headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in orjson.loads(cached_response["headers"])
+        ]
+        return replayed
     
     # Process request
     response = await call_next(request)
     
-    # Cache response
-    response_body = b""
-    async for chunk in response.body_iterator:
-        response_body += chunk
+    # Stream the body through unchanged while keeping a copy for the cache
+    body_iterator = response.body_iterator
+    body_buffer = io.BytesIO()
+    
+    async def cache_while_streaming():
+        async for chunk in body_iterator:
+            body_buffer.write(chunk)
+            yield chunk
+        
+        # Only reached once the whole body was sent; the response runs its
+        # background task after streaming, off the request path
+        response.background = BackgroundTask(
+            store_idempotent_response,
+            cache_key,
+            response.status_code,
+            response.raw_headers,
+            body_buffer.getvalue()
+        )
     
+    response.body_iterator = cache_while_streaming()
+    return response
+
+
+def store_idempotent_response(cache_key: str, status_code: int, raw_headers: list, body: bytes):
+    """Store a response's status, headers and raw bytes for replay on a repeated Idempotency-Key."""
+    # Headers are latin-1 on the wire; a JSON list keeps repeated names and order
     response_data = {
-        "status_code": response.status_code,
-        "content": json.loads(response_body.decode()) if response_body else {},
-        "headers": dict(response.headers)
+        "status_code": status_code,
+        "headers": orjson.dumps([(name.decode("latin-1"), value.decode("latin-1")) for name, value in raw_headers]),
+        "body": body
     }
     
     if redis_client:
         try:
-            redis_client.setex(cache_key, 3600, json.dumps(response_data))  # Cache for 1 hour
+            pipeline = redis_client.pipeline()
+            pipeline.hset(cache_key, mapping=response_data)
+            pipeline.expire(cache_key, 3600)  # Cache for 1 hour
+            pipeline.execute()
         except:
             pass
     
-    idempotency_cache[cache_key] = response_data
-    
-    # Return response
-    return JSONResponse(
-        status_code=response.status_code,
-        content=response_data["content"],
-        headers=response_data["headers"]
-    )
+    with idempotency_cache_lock:
+        idempotency_cache[cache_key] = response_data
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with uniform error format."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -165,7 +201,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     if errors:
         error = errors[0]
         field = ".".join(str(loc) for loc in error["loc"][1:])  # Skip "body" prefix
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": {
@@ -176,7 +212,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             }
         )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": {
@@ -190,7 +226,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions with uniform error format."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index, DDL, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import ARRAY
@@ -21,6 +21,8 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     role = Column(Enum(UserRole), nullable=False)
+    # created_at defaults are set client-side, so a flushed row already has
+    # them and handlers can respond without re-selecting it
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -40,6 +42,34 @@ class Resume(Base):
     
     # Relationships
     owner = relationship("User", back_populates="resumes")
+    
+    __table_args__ = (
+        # Keyset pagination on (created_at, id); btree indexes scan in either direction
+        Index("ix_resumes_created_id", "created_at", "id"),
+        # Trigram index so ILIKE '%q%' searches don't scan the whole table
+        Index(
+            "ix_resumes_redacted_trgm",
+            "pii_redacted_content",
+            postgresql_using="gin",
+            postgresql_ops={"pii_redacted_content": "gin_trgm_ops"}
+        ),
+        # Approximate nearest neighbour index for ORDER BY embedding <=> :q
+        Index(
+            "ix_resumes_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"}
+        ),
+    )
+
+
+# gin_trgm_ops requires the pg_trgm extension
+event.listen(
+    Resume.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
 
 
 class Job(Base):
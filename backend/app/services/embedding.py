@@ -0,0 +1,154 @@
+import logging
+import os
+from typing import List, Union
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
+from ..core.config import settings
+
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIMENSION = 384
+QUANTIZED_MODEL_FILE = "model_optimized_quantized.onnx"
+# Same truncation length SentenceTransformer uses for all-MiniLM-L6-v2
+MAX_SEQ_LENGTH = 256
+
+logger = logging.getLogger(__name__)
+
+
+def cpus_per_worker() -> int:
+    """CPUs available to each of the WORKERS uvicorn processes."""
+    return max(1, (os.cpu_count() or 1) // max(1, settings.workers))
+
+
+def embedding_thread_count() -> int:
+    """Threads per process for model inference: EMBED_THREADS, or the CPUs split across WORKERS."""
+    if settings.embed_threads:
+        return settings.embed_threads
+    return cpus_per_worker()
+
+
+def build_onnx_model(model_dir: str) -> None:
+    """Export all-MiniLM-L6-v2 to ONNX, apply graph optimizations and int8 quantization."""
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTOptimizer, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig, OptimizationConfig
+    from transformers import AutoTokenizer
+
+    model = ORTModelForFeatureExtraction.from_pretrained(EMBEDDING_MODEL_NAME, export=True)
+    tokenizer = AutoTokenizer.from_pretrained(EMBEDDING_MODEL_NAME)
+
+    # Graph optimizations (writes model_optimized.onnx)
+    optimizer = ORTOptimizer.from_pretrained(model)
+    optimizer.optimize(
+        save_dir=model_dir,
+        optimization_config=OptimizationConfig(optimization_level=99)
+    )
+
+    # Dynamic int8 quantization (writes model_optimized_quantized.onnx)
+    quantizer = ORTQuantizer.from_pretrained(model_dir, file_name="model_optimized.onnx")
+    quantizer.quantize(
+        save_dir=model_dir,
+        quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=True)
+    )
+
+    tokenizer.save_pretrained(model_dir)
+
+
+class OnnxMiniLMEncoder:
+    """ONNX Runtime encoder exposing the subset of SentenceTransformer used by the service."""
+
+    def __init__(self, model_dir: str, num_threads: int):
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        # The model is built ahead of time (python -m app.services.embedding),
+        # never while serving
+        model_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"ONNX embedding model not found at {model_path}")
+
+        # A single sequential graph: parallelism comes from intra-op threads only
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = num_threads
+        session_options.inter_op_num_threads = 1
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir,
+            file_name=QUANTIZED_MODEL_FILE,
+            provider="CPUExecutionProvider",
+            session_options=session_options
+        )
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False
+    ) -> np.ndarray:
+        """Encode text into mean-pooled 384-dimensional embeddings."""
+        single_input = isinstance(sentences, str)
+        if single_input:
+            sentences = [sentences]
+
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            features = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=MAX_SEQ_LENGTH,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**features).last_hidden_state
+
+            # Mean pooling over non-padding tokens
+            mask = features["attention_mask"][..., np.newaxis].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            counts = np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(summed / counts)
+
+        embeddings = np.concatenate(batches).astype(np.float32) if batches else np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
+
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings[0] if single_input else embeddings
+
+
+def load_embedding_model():
+    """Load the configured embedding backend, falling back to PyTorch if ONNX is unavailable."""
+    num_threads = embedding_thread_count()
+    
+    if settings.embedding_backend == "onnx":
+        try:
+            return OnnxMiniLMEncoder(settings.onnx_model_dir, num_threads)
+        except Exception:
+            # Model not built, optimum/onnxruntime not installed, or the model failed to load
+            logger.exception("Could not load ONNX embedding model; falling back to PyTorch")
+
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable once per process, before any inter-op work has run
+        pass
+    
+    model = SentenceTransformer('all-MiniLM-L6-v2')
+    
+    # Dynamic int8 quantization of the Linear layers, matching the ONNX path
+    transformer = model[0]
+    transformer.auto_model = torch.quantization.quantize_dynamic(
+        transformer.auto_model,
+        {torch.nn.Linear},
+        dtype=torch.qint8
+    )
+    return model
+
+
+if __name__ == "__main__":
+    build_onnx_model(settings.onnx_model_dir)
@@ -1,28 +1,105 @@
 import io
+import multiprocessing
+import threading
+import hashlib
+import itertools
 import zipfile
-from typing import List, Tuple, Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import BinaryIO, FrozenSet, Iterable, Iterator, List, Set, Tuple, Optional
+import msgpack
 import pypdf
 from docx import Document
 import spacy
-from sentence_transformers import SentenceTransformer
+from spacy.matcher import PhraseMatcher
 import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, select, text, update
+from pgvector.sqlalchemy import Vector
 from ..models.models import Resume, Job
+from ..core.cache import SemanticQueryCache, redis_client
+from ..core.config import settings
+from .embedding import EMBEDDING_DIMENSION, cpus_per_worker, load_embedding_model
 import re
 
 
+# Batch size used for bulk encoding
+EMBEDDING_BATCH_SIZE = 64
+# Resumes embedded per round trip by the background backfill
+EMBEDDING_BACKFILL_BATCH_SIZE = 128
+
+# Uncompressed size limit for a single resume inside a ZIP upload
+MAX_ZIP_MEMBER_SIZE = 20 * 1024 * 1024
+
+# Files submitted to the extraction pool but not yet collected
+MAX_PENDING_EXTRACTIONS = 2 * cpus_per_worker()
+
+# HNSW candidate list size for vector searches (higher = better recall, slower)
+HNSW_EF_SEARCH = 40
+
+# PII patterns, fused into single alternations so each text is scanned once
+REDACTED = "[REDACTED]"
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+PHONE_PATTERN = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+NAME_PATTERN = r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'
+CONTACT_PII_PATTERN = re.compile(f"(?P<email>{EMAIL_PATTERN})|(?P<phone>{PHONE_PATTERN})")
+PII_PATTERN = re.compile(f"(?P<email>{EMAIL_PATTERN})|(?P<phone>{PHONE_PATTERN})|(?P<name>{NAME_PATTERN})")
+
+# Words of four or more letters are used as keywords for evidence matching
+KEYWORD_PATTERN = re.compile(r"[a-z]{4,}")
+
+# Phrases marking a job description line as a requirement
+REQUIREMENT_PATTERN = re.compile(r"required|must have|should have|experience|skills", re.IGNORECASE)
+
+# Query embedding cache sizes
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+QUERY_EMBEDDING_TTL_SECONDS = 86400
+
+# Jobs are immutable once created, so their match context can be cached
+JOB_MATCH_CONTEXT_TTL_SECONDS = 3600
+
+
+@dataclass
+class JobMatchContext:
+    """Per-job data needed to match candidates, derived once and cached by job id."""
+    embedding: np.ndarray
+    keywords: FrozenSet[str]
+    requirements: List[str]
+
+
 class ResumeProcessingService:
-    def __init__(self):
-        # Load spaCy model for PII detection
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Fallback if model not found
-            self.nlp = None
+    def __init__(self, with_embedding_model: bool = True):
+        # spaCy NER for PII detection is opt-in; the regex patterns cover the default path
+        self.nlp = None
+        if settings.pii_ner_enabled:
+            try:
+                # Only the NER component is used, so skip loading the rest of the pipeline
+                self.nlp = spacy.load(
+                    "en_core_web_sm",
+                    exclude=["tok2vec", "tagger", "parser", "lemmatizer", "attribute_ruler"]
+                )
+            except OSError:
+                # Fallback if model not found
+                self.nlp = None
+        
+        # Load embedding model (quantized ONNX by default, PyTorch as fallback);
+        # extraction workers skip it
+        self.embedding_model = load_embedding_model() if with_embedding_model else None
+        
+        # Process-local cache in front of the shared Redis cache for query embeddings
+        self._cached_query_embedding = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(
+            self._compute_query_embedding
+        )
         
-        # Load sentence transformer model
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Search results reused for near-duplicate queries; without a model
+        # this service never searches
+        self.semantic_cache = (
+            SemanticQueryCache(dimension=EMBEDDING_DIMENSION, redis_client=redis_client)
+            if with_embedding_model else None
+        )
     
     def extract_text_from_pdf(self, file_content: bytes) -> str:
         """Extract text from PDF file."""
@@ -58,70 +135,173 @@ class ResumeProcessingService:
     def redact_pii(self, text: str) -> str:
         """Redact PII from text using spaCy."""
         if not self.nlp:
-            # Simple regex fallback if spaCy model not available
-            # Redact email addresses
-            text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[REDACTED]', text)
-            # Redact phone numbers
-            text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[REDACTED]', text)
-            # Redact names (simple pattern)
-            text = re.sub(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', '[REDACTED]', text)
-            return text
+            # Simple regex fallback if spaCy model not available:
+            # emails, phone numbers and names in a single pass
+            return PII_PATTERN.sub(REDACTED, text)
         
         doc = self.nlp(text)
-        redacted_text = text
+        spans = []
         
-        # Redact names, emails, and phone numbers
-        for ent in doc.ents:
-            if ent.label_ in ["PERSON", "EMAIL", "PHONE"]:
-                redacted_text = redacted_text.replace(ent.text, "[REDACTED]")
+        # Redact every occurrence of detected names, emails, and phone numbers
+        entity_texts = {ent.text for ent in doc.ents if ent.label_ in ["PERSON", "EMAIL", "PHONE"]}
+        if entity_texts:
+            matcher = PhraseMatcher(self.nlp.vocab)
+            matcher.add("PII", [self.nlp.make_doc(entity_text) for entity_text in entity_texts])
+            for _, start, end in matcher(doc):
+                spans.append((doc[start].idx, doc[end - 1].idx + len(doc[end - 1])))
         
         # Additional regex patterns for better coverage
-        redacted_text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[REDACTED]', redacted_text)
-        redacted_text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[REDACTED]', redacted_text)
+        spans.extend(match.span() for match in CONTACT_PII_PATTERN.finditer(text))
+        
+        return _replace_spans(text, spans)
+    
+    def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate an L2-normalized float32 embedding for text."""
+        embedding = self.embedding_model.encode(text, normalize_embeddings=True)
+        return np.asarray(embedding, dtype=np.float32)
+    
+    def embed_query(self, query: str) -> np.ndarray:
+        """Generate embedding for a search query, reusing cached embeddings for repeated queries."""
+        # The model is uncased, so normalizing case and whitespace doesn't change the vector
+        return self._cached_query_embedding(query.strip().lower())
+    
+    def _compute_query_embedding(self, normalized_query: str) -> np.ndarray:
+        """Look up a query embedding in Redis, computing and storing it on a miss."""
+        cache_key = f"emb:{hashlib.sha256(normalized_query.encode()).hexdigest()}"
         
-        return redacted_text
+        if redis_client:
+            try:
+                cached_embedding = redis_client.get(cache_key)
+                if cached_embedding:
+                    return np.frombuffer(cached_embedding, dtype=np.float32)
+            except:
+                pass
+        
+        embedding = self.generate_embedding(normalized_query)
+        # Cached arrays are shared between callers
+        embedding.setflags(write=False)
+        
+        if redis_client:
+            try:
+                redis_client.setex(cache_key, QUERY_EMBEDDING_TTL_SECONDS, embedding.tobytes())
+            except:
+                pass
+        
+        return embedding
     
-    def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text using sentence transformers."""
-        embedding = self.embedding_model.encode(text)
-        return embedding.tolist()
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Generate normalized embeddings for many texts in a single encode call."""
+        if not texts:
+            return np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
+
+        # Sort by token length so each mini-batch pads to a similar length
+        token_ids = self.embedding_model.tokenizer(texts, truncation=True, padding=False)["input_ids"]
+        order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+
+        sorted_embeddings = self.embedding_model.encode(
+            [texts[i] for i in order],
+            batch_size=EMBEDDING_BATCH_SIZE,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
+        # Restore the caller's ordering
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
     
-    def process_resume_file(self, filename: str, file_content: bytes) -> Tuple[str, str, List[float]]:
-        """Process a resume file and return content, redacted content, and embedding."""
+    def extract_and_redact(self, filename: str, file_content: bytes) -> Tuple[str, str]:
+        """Extract text from a resume file and return content and redacted content."""
         # Extract text
         content_text = self.extract_text_from_file(filename, file_content)
         
         # Redact PII
         pii_redacted_content = self.redact_pii(content_text)
         
-        # Generate embedding
-        embedding = self.generate_embedding(pii_redacted_content)
-        
-        return content_text, pii_redacted_content, embedding
+        return content_text, pii_redacted_content
     
-    def process_zip_file(self, zip_content: bytes) -> List[Tuple[str, str, str, List[float]]]:
-        """Process a ZIP file containing multiple resumes."""
+    def extract_and_redact_many(self, files: Iterable[Tuple[str, bytes]]) -> List[Tuple[str, str, str]]:
+        """Extract and redact many files in parallel, skipping files that can't be processed."""
+        files = iter(files)
+        first_files = list(itertools.islice(files, 2))
+        
+        # A single file isn't worth the round trip to a worker process
+        if len(first_files) < 2:
+            results = [_try_extract_and_redact(self, filename, file_content) for filename, file_content in first_files]
+            return [result for result in results if result is not None]
+        
+        # Keep a bounded number of files in flight so large ZIPs aren't held in memory at once
+        pending = deque()
         results = []
+        for file in itertools.chain(first_files, files):
+            pending.append(_submit_extraction(file))
+            if len(pending) >= MAX_PENDING_EXTRACTIONS:
+                results.append(_extraction_result(*pending.popleft()))
+        results.extend(_extraction_result(pool, future) for pool, future in pending)
         
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zip_file:
-            for filename in zip_file.namelist():
-                if filename.lower().endswith(('.pdf', '.docx')):
-                    try:
-                        file_content = zip_file.read(filename)
-                        content_text, pii_redacted_content, embedding = self.process_resume_file(
-                            filename, file_content
-                        )
-                        results.append((filename, content_text, pii_redacted_content, embedding))
-                    except Exception as e:
-                        # Skip files that can't be processed
-                        continue
+        return [result for result in results if result is not None]
+    
+    def iter_zip_file(self, zip_file_obj: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+        """Yield the supported resume files in a ZIP file one member at a time."""
+        with zipfile.ZipFile(zip_file_obj) as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(('.pdf', '.docx')):
+                    continue
+                
+                # Skip oversized members rather than reading them into memory
+                if info.file_size > MAX_ZIP_MEMBER_SIZE:
+                    continue
+                
+                # A corrupt, encrypted or unsupported member only skips itself
+                try:
+                    with zip_file.open(info) as member:
+                        file_content = member.read()
+                except (zipfile.BadZipFile, RuntimeError, NotImplementedError, OSError):
+                    continue
+                
+                yield info.filename, file_content
+    
+    def embed_pending_resumes(self, db: Session) -> int:
+        """Fill in embeddings for resumes stored without one, in batches."""
+        embedded = 0
+        while True:
+            # Skip rows another backfill is already embedding
+            pending = db.execute(
+                select(Resume.id, Resume.pii_redacted_content)
+                .where(Resume.embedding.is_(None))
+                .order_by(Resume.id)
+                .limit(EMBEDDING_BACKFILL_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not pending:
+                break
+            
+            embeddings = self.embed_batch([row.pii_redacted_content for row in pending])
+            
+            # One executemany UPDATE ... WHERE id = :id for the whole batch
+            db.execute(
+                update(Resume),
+                [{"id": row.id, "embedding": embedding} for row, embedding in zip(pending, embeddings)]
+            )
+            db.commit()
+            embedded += len(pending)
         
-        return results
+        if embedded and self.semantic_cache is not None:
+            # Cached search results don't include the newly embedded resumes
+            self.semantic_cache.clear()
+        
+        return embedded
     
     def search_similar_resumes(self, query: str, k: int, db: Session) -> List[dict]:
         """Search for similar resumes using vector similarity."""
         # Generate embedding for query
-        query_embedding = self.generate_embedding(query)
+        query_embedding = self.embed_query(query)
+        
+        # Reuse results of a semantically equivalent earlier query
+        cached_results = self.semantic_cache.get(query_embedding, k)
+        if cached_results is not None:
+            return cached_results
         
         # Perform vector similarity search
         query_sql = text("""
@@ -131,8 +311,9 @@ class ResumeProcessingService:
             WHERE embedding IS NOT NULL
             ORDER BY embedding <=> :query_embedding
             LIMIT :k
-        """)
+        """).bindparams(bindparam("query_embedding", type_=Vector(EMBEDDING_DIMENSION)))
         
+        self._set_hnsw_ef_search(db)
         result = db.execute(
             query_sql,
             {
@@ -150,17 +331,13 @@ class ResumeProcessingService:
                 "similarity_score": 1 - row.distance  # Convert distance to similarity
             })
         
+        self.semantic_cache.put(query_embedding, k, results)
+        
         return results
     
     def match_candidates(self, job_id: int, top_n: int, db: Session) -> Tuple[List[dict], List[str]]:
         """Match candidates to a job using vector similarity."""
-        # Get job details
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if not job:
-            raise ValueError("Job not found")
-        
-        if not job.embedding:
-            raise ValueError("Job has no embedding")
+        job_context = self.get_job_match_context(job_id, db)
         
         # Perform vector similarity search
         query_sql = text("""
@@ -170,12 +347,13 @@ class ResumeProcessingService:
             WHERE r.embedding IS NOT NULL
             ORDER BY r.embedding <=> :job_embedding
             LIMIT :top_n
-        """)
+        """).bindparams(bindparam("job_embedding", type_=Vector(EMBEDDING_DIMENSION)))
         
+        self._set_hnsw_ef_search(db)
         result = db.execute(
             query_sql,
             {
-                "job_embedding": job.embedding,
+                "job_embedding": job_context.embedding,
                 "top_n": top_n
             }
         ).fetchall()
@@ -183,7 +361,7 @@ class ResumeProcessingService:
         matches = []
         for row in result:
             similarity_score = 1 - row.distance
-            evidence = self._extract_evidence(row.pii_redacted_content, job.description_text)
+            evidence = self._extract_evidence(row.pii_redacted_content, job_context.keywords)
             
             matches.append({
                 "resume_id": row.id,
@@ -194,39 +372,92 @@ class ResumeProcessingService:
         
         # Analyze missing requirements
         missing_requirements = self._analyze_missing_requirements(
-            job.description_text, [match["evidence"] for match in matches]
+            job_context.requirements, [match["evidence"] for match in matches]
         )
         
         return matches, missing_requirements
     
-    def _extract_evidence(self, resume_content: str, job_description: str) -> str:
+    def get_job_match_context(self, job_id: int, db: Session) -> JobMatchContext:
+        """Get a job's embedding, keywords and requirements, from Redis when cached."""
+        cache_key = f"jobctx:{job_id}"
+        
+        if redis_client:
+            try:
+                cached_context = redis_client.get(cache_key)
+                if cached_context:
+                    data = msgpack.unpackb(cached_context)
+                    return JobMatchContext(
+                        embedding=np.frombuffer(data["embedding"], dtype=np.float32),
+                        keywords=frozenset(data["keywords"]),
+                        requirements=data["requirements"]
+                    )
+            except:
+                pass
+        
+        # Get job details
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise ValueError("Job not found")
+        
+        if job.embedding is None:
+            raise ValueError("Job has no embedding")
+        
+        job_context = JobMatchContext(
+            embedding=np.asarray(job.embedding, dtype=np.float32),
+            keywords=frozenset(self._extract_keywords(job.description_text)),
+            requirements=self._extract_requirements(job.description_text)
+        )
+        
+        if redis_client:
+            try:
+                redis_client.setex(
+                    cache_key,
+                    JOB_MATCH_CONTEXT_TTL_SECONDS,
+                    msgpack.packb({
+                        "embedding": job_context.embedding.tobytes(),
+                        "keywords": sorted(job_context.keywords),
+                        "requirements": job_context.requirements
+                    })
+                )
+            except:
+                pass
+        
+        return job_context
+    
+    def _set_hnsw_ef_search(self, db: Session) -> None:
+        """Set the HNSW search breadth for the current transaction."""
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH}"))
+    
+    def _extract_keywords(self, text: str) -> Set[str]:
+        """Extract the set of lowercase keywords (4+ letters) from text."""
+        return set(KEYWORD_PATTERN.findall(text.lower()))
+    
+    def _extract_evidence(self, resume_content: str, job_keywords: FrozenSet[str]) -> str:
         """Extract relevant evidence from resume that matches job requirements."""
         # Simple keyword matching for evidence extraction
-        job_keywords = set(job_description.lower().split())
-        resume_sentences = resume_content.split('.')
-        
         evidence_sentences = []
-        for sentence in resume_sentences:
-            sentence_lower = sentence.lower()
-            if any(keyword in sentence_lower for keyword in job_keywords if len(keyword) > 3):
+        for sentence in resume_content.split('.'):
+            if not job_keywords.isdisjoint(KEYWORD_PATTERN.findall(sentence.lower())):
                 evidence_sentences.append(sentence.strip())
+                if len(evidence_sentences) == 3:  # Return top 3 evidence sentences
+                    break
         
-        return '. '.join(evidence_sentences[:3])  # Return top 3 evidence sentences
+        return '. '.join(evidence_sentences)
     
-    def _analyze_missing_requirements(self, job_description: str, evidence_texts: List[str]) -> List[str]:
+    def _analyze_missing_requirements(self, job_requirements: List[str], evidence_texts: List[str]) -> List[str]:
         """Analyze what requirements are missing from the matched candidates."""
-        # Extract key requirements from job description
-        job_requirements = self._extract_requirements(job_description)
-        
-        # Combine all evidence texts
-        combined_evidence = ' '.join(evidence_texts).lower()
+        # Combine all evidence keywords
+        evidence_keywords = self._extract_keywords(' '.join(evidence_texts))
         
         missing_requirements = []
         for requirement in job_requirements:
-            if not any(keyword in combined_evidence for keyword in requirement.lower().split()):
+            if evidence_keywords.isdisjoint(KEYWORD_PATTERN.findall(requirement.lower())):
                 missing_requirements.append(requirement)
+                if len(missing_requirements) == 5:  # Return top 5 missing requirements
+                    break
         
-        return missing_requirements[:5]  # Return top 5 missing requirements
+        return missing_requirements
     
     def _extract_requirements(self, job_description: str) -> List[str]:
         """Extract key requirements from job description."""
@@ -236,12 +467,120 @@ class ResumeProcessingService:
         
         for line in lines:
             line = line.strip()
-            if any(keyword in line.lower() for keyword in ['required', 'must have', 'should have', 'experience', 'skills']):
+            if REQUIREMENT_PATTERN.search(line):
                 if len(line) > 10:  # Filter out very short lines
                     requirements.append(line)
         
         return requirements
 
 
-# Global instance
-resume_service = ResumeProcessingService()
+def _replace_spans(text: str, spans: List[Tuple[int, int]]) -> str:
+    """Replace (start, end) character spans with the redaction marker, merging overlaps."""
+    parts = []
+    last_end = 0
+    for start, end in sorted(spans):
+        if start >= last_end:
+            parts.append(text[last_end:start])
+            parts.append(REDACTED)
+            last_end = end
+        elif end > last_end:
+            # Overlaps the previous span; extend the same redaction
+            last_end = end
+    parts.append(text[last_end:])
+    
+    return "".join(parts)
+
+
+def _try_extract_and_redact(
+    service: ResumeProcessingService, filename: str, file_content: bytes
+) -> Optional[Tuple[str, str, str]]:
+    """Extract and redact a file, returning None if it can't be processed."""
+    try:
+        content_text, pii_redacted_content = service.extract_and_redact(filename, file_content)
+    except Exception:
+        return None
+    
+    return filename, content_text, pii_redacted_content
+
+
+# Extraction runs in worker processes; each worker lazily creates its own
+# service (spaCy only, no embedding model) and reuses it across tasks
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+_worker_service: Optional[ResumeProcessingService] = None
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Create the extraction process pool on first use."""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            # Forking this process, which already runs inference thread pools,
+            # can deadlock the children; start them from a clean forkserver
+            _extraction_pool = ProcessPoolExecutor(
+                max_workers=cpus_per_worker(),
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+    return _extraction_pool
+
+
+def _discard_extraction_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken extraction pool so the next submission starts a new one."""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        # Another thread may already have replaced it
+        if _extraction_pool is pool:
+            _extraction_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_extraction(file: Tuple[str, bytes]) -> Tuple[ProcessPoolExecutor, Future]:
+    """Submit a file to the extraction pool, replacing the pool if it is broken."""
+    pool = _get_extraction_pool()
+    try:
+        return pool, pool.submit(_extract_and_redact_worker, file)
+    except BrokenProcessPool:
+        _discard_extraction_pool(pool)
+        pool = _get_extraction_pool()
+        return pool, pool.submit(_extract_and_redact_worker, file)
+
+
+def _extraction_result(pool: ProcessPoolExecutor, future: Future) -> Optional[Tuple[str, str, str]]:
+    """Wait for an extraction, returning None if its worker process died."""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # A worker was killed (e.g. out of memory on a huge PDF); the files in
+        # flight are skipped like other unprocessable files rather than
+        # retried here, where the same file could take down the API process
+        _discard_extraction_pool(pool)
+        return None
+
+
+def _extract_and_redact_worker(file: Tuple[str, bytes]) -> Optional[Tuple[str, str, str]]:
+    """Process pool entry point for extracting and redacting a single file."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = ResumeProcessingService(with_embedding_model=False)
+    
+    filename, file_content = file
+    return _try_extract_and_redact(_worker_service, filename, file_content)
+
+
+_resume_service: Optional[ResumeProcessingService] = None
+_resume_service_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    """Create the global resume_service on first import of it.
+    
+    Extraction worker processes import this module too but never use the
+    global instance, so they don't load the embedding model.
+    """
+    if name == "resume_service":
+        global _resume_service
+        with _resume_service_lock:
+            if _resume_service is None:
+                _resume_service = ResumeProcessingService()
+        return _resume_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
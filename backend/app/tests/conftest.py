@@ -0,0 +1,108 @@
+import os
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from app.core.config import settings
+from app.main import app
+from app.models.models import Base
+
+# Create test database in memory, one per pytest-xdist worker; StaticPool
+# keeps its single connection (and so the database) alive and shared by
+# every session
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+SQLALCHEMY_DATABASE_URL = f"sqlite+pysqlite:///file:memdb_{XDIST_WORKER}?mode=memory&cache=shared&uri=true"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False, "uri": True},
+    poolclass=StaticPool
+)
+
+
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    """Tune SQLite for throwaway test data and let SQLAlchemy emit BEGIN itself."""
+    cursor = dbapi_connection.cursor()
+    # No fsync or rollback journal on disk; nothing here needs to survive a crash
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Size pages and mapped memory up front; page_size only applies before the
+    # first table is created, and mmap_size takes effect if the database is a file
+    cursor.execute("PRAGMA page_size=8192")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+    
+    # pysqlite's implicit transactions break SAVEPOINTs
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+class FakeClock:
+    """Stand-in for the time module; only moves when a test advances now."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """Freeze the clocks of the rate limiter and semantic cache."""
+    clock = FakeClock()
+    monkeypatch.setattr("app.core.rate_limit.time", clock)
+    monkeypatch.setattr("app.core.cache.time", clock)
+    return clock
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Swap bcrypt for a no-op hasher; bcrypt's cost dominates fixture setup."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("app.core.security.pwd_context", CryptContext(schemes=["plaintext"]))
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _init_db():
+    """Create the tables once per test session, whatever order tests are collected in."""
+    Base.metadata.create_all(bind=engine)
+
+
+@pytest.fixture
+def db_session():
+    """Session whose work is rolled back at the end of each test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    
+    # commit() inside the test releases a SAVEPOINT; the outer transaction
+    # is never committed
+    session = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+    
+    yield session
+    
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session, so app startup/shutdown runs once."""
+    # The embedding backfill sweep would run against the app's own database
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(settings, "embedding_backfill_interval_seconds", 0)
+        with TestClient(app) as test_client:
+            yield test_client
@@ -1,50 +1,37 @@
+import asyncio
+import io
+import zipfile
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from docx import Document
+from datetime import datetime, timedelta
 from app.main import app
 from app.database import get_db
-from app.models.models import Base, User, Resume, Job
+from app.models.models import Resume, User
 from app.core.security import get_password_hash
+from app.core.rate_limit import SlidingWindowRateLimiter
 
-# Create test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-app.dependency_overrides[get_db] = override_get_db
-
-client = TestClient(app)
+@pytest.fixture(autouse=True)
+def override_get_db(db_session):
+    """Serve every request from the test's transactional session, only for this test."""
+    app.dependency_overrides[get_db] = lambda: db_session
+    yield
+    app.dependency_overrides.pop(get_db, None)
 
 @pytest.fixture
-def test_user():
+def test_user(db_session):
     """Create a test user."""
-    db = TestingSessionLocal()
     user = User(
         email="test@example.com",
         hashed_password=get_password_hash("testpassword"),
         role="recruiter"
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    yield user
-    db.delete(user)
-    db.commit()
-    db.close()
+    db_session.add(user)
+    db_session.commit()
+    return user
 
 @pytest.fixture
-def auth_headers(test_user):
+def auth_headers(client, test_user):
     """Get authentication headers for test user."""
     response = client.post("/api/login", json={
         "email": "test@example.com",
@@ -53,7 +40,7 @@ def auth_headers(test_user):
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
 
-def test_register():
+def test_register(client):
     """Test user registration."""
     response = client.post("/api/register", json={
         "email": "newuser@example.com",
@@ -65,7 +52,7 @@ def test_register():
     assert data["email"] == "newuser@example.com"
     assert data["role"] == "recruiter"
 
-def test_login(test_user):
+def test_login(client, test_user):
     """Test user login."""
     response = client.post("/api/login", json={
         "email": "test@example.com",
@@ -76,7 +63,7 @@ def test_login(test_user):
     assert "access_token" in data
     assert data["token_type"] == "bearer"
 
-def test_login_invalid_credentials():
+def test_login_invalid_credentials(client):
     """Test login with invalid credentials."""
     response = client.post("/api/login", json={
         "email": "test@example.com",
@@ -84,23 +71,38 @@ def test_login_invalid_credentials():
     })
     assert response.status_code == 401
 
-def test_create_job(auth_headers):
+def test_idempotent_replay(client):
+    """Test a repeated Idempotency-Key replays the first response byte for byte."""
+    request = {
+        "json": {"email": "idempotent@example.com", "password": "password", "role": "recruiter"},
+        "headers": {"Idempotency-Key": "register-idempotent@example.com"}
+    }
+    first = client.post("/api/register", **request)
+    # Without the replay this would be rejected as an already registered email
+    second = client.post("/api/register", **request)
+    
+    assert first.status_code == 200
+    assert second.status_code == first.status_code
+    assert second.headers.raw == first.headers.raw
+    assert second.content == first.content
+
+def test_create_job(client, auth_headers):
     """Test job creation."""
     response = client.post("/api/jobs", json={
         "title": "Python Developer",
-        "description": "Looking for a Python developer with FastAPI experience"
+        "description_text": "Looking for a Python developer with FastAPI experience"
     }, headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert data["title"] == "Python Developer"
     assert data["description_text"] == "Looking for a Python developer with FastAPI experience"
 
-def test_get_job(auth_headers):
+def test_get_job(client, auth_headers):
     """Test getting a job."""
     # First create a job
     create_response = client.post("/api/jobs", json={
         "title": "Test Job",
-        "description": "Test description"
+        "description_text": "Test description"
     }, headers=auth_headers)
     job_id = create_response.json()["id"]
     
@@ -110,7 +112,109 @@ def test_get_job(auth_headers):
     data = response.json()
     assert data["title"] == "Test Job"
 
-def test_ask_question(auth_headers):
+def docx_bytes(text):
+    """Build a one-paragraph DOCX file in memory."""
+    document = Document()
+    document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+@pytest.fixture
+def no_embedding_backfill(monkeypatch):
+    """Keep the post-upload embedding task off the app's own database."""
+    monkeypatch.setattr("app.api.resumes.embed_pending_resumes", lambda: None)
+
+def test_upload_resume(client, auth_headers, no_embedding_backfill, db_session):
+    """Test uploading a single resume stores it and returns the inserted row."""
+    response = client.post(
+        "/api/resumes",
+        files=[("files", ("resume.docx", docx_bytes("Python developer, mail me at dev@example.com"), "application/octet-stream"))],
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    [uploaded] = response.json()
+    assert uploaded["filename"] == "resume.docx"
+    assert uploaded["pii_redacted_content"] == "Python developer, mail me at [REDACTED]"
+    
+    stored = db_session.get(Resume, uploaded["id"])
+    assert stored.filename == "resume.docx"
+    assert stored.embedding is None
+
+def test_upload_zip_skips_corrupt_member(client, auth_headers, no_embedding_backfill):
+    """Test a corrupt ZIP member is skipped while the rest of the archive is stored."""
+    corrupt = docx_bytes("Resume B")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_file:
+        zip_file.writestr("a.docx", docx_bytes("Resume A"))
+        zip_file.writestr("b.docx", corrupt)
+        zip_file.writestr("c.docx", docx_bytes("Resume C"))
+    
+    # Flip a byte of b.docx so reading it fails its CRC check
+    archive = bytearray(buffer.getvalue())
+    archive[archive.index(corrupt) + len(corrupt) // 2] ^= 0xFF
+    
+    response = client.post(
+        "/api/resumes",
+        files=[("files", ("resumes.zip", bytes(archive), "application/zip"))],
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    assert [(r["filename"], r["content_text"]) for r in response.json()] == [
+        ("a.docx", "Resume A"),
+        ("c.docx", "Resume C"),
+    ]
+
+@pytest.fixture
+def resumes(db_session, test_user):
+    """Create five resumes, two of them sharing a created_at timestamp."""
+    created_at = datetime(2024, 1, 1)
+    rows = [
+        Resume(
+            filename=f"resume{i}.pdf",
+            content_text=f"Resume {i}",
+            pii_redacted_content=f"Resume {i}",
+            owner_id=test_user.id,
+            created_at=created_at + timedelta(minutes=min(i, 3))
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    # Newest first, ties broken by id
+    return sorted(rows, key=lambda resume: (resume.created_at, resume.id), reverse=True)
+
+def test_get_resumes_cursor_pagination(client, auth_headers, resumes):
+    """Test walking every page with the X-Next-Cursor header."""
+    seen_ids = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/resumes", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen_ids.extend(resume["id"] for resume in response.json())
+        
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+    
+    assert seen_ids == [resume.id for resume in resumes]
+
+def test_get_resumes_offset_fallback(client, auth_headers, resumes):
+    """Test the deprecated offset parameter still pages."""
+    response = client.get("/api/resumes", params={"limit": 2, "offset": 2}, headers=auth_headers)
+    assert response.status_code == 200
+    assert [resume["id"] for resume in response.json()] == [resume.id for resume in resumes[2:4]]
+
+def test_get_resumes_invalid_cursor(client, auth_headers):
+    """Test a malformed cursor is rejected."""
+    response = client.get("/api/resumes", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Invalid cursor"
+
+def test_ask_question(client, auth_headers):
     """Test asking questions about resumes."""
     response = client.post("/api/ask", json={
         "query": "Who has Python experience?",
@@ -121,18 +225,24 @@ def test_ask_question(auth_headers):
     assert "results" in data
     assert isinstance(data["results"], list)
 
-def test_rate_limiting():
-    """Test rate limiting middleware."""
-    # Make 61 requests quickly to trigger rate limit
-    for i in range(61):
-        response = client.get("/")
-        if response.status_code == 429:
-            assert response.json()["error"]["code"] == "RATE_LIMIT"
-            break
-    else:
-        pytest.fail("Rate limiting should have been triggered")
+@pytest.mark.asyncio
+async def test_rate_limiting(monkeypatch):
+    """Test the rate limiting middleware returns the uniform 429 response."""
+    # The limiter itself is unit tested in test_rate_limit.py
+    monkeypatch.setattr("app.main.rate_limiter", SlidingWindowRateLimiter(None, limit=5, window_seconds=60))
+    
+    # Send one request over the limit concurrently over a single connection pool
+    async with httpx.AsyncClient(app=app, base_url="http://test") as async_client:
+        responses = await asyncio.gather(*(async_client.get("/") for _ in range(6)))
+    
+    status_codes = [response.status_code for response in responses]
+    assert status_codes.count(200) == 5
+    assert status_codes.count(429) == 1
+    
+    rejected = next(response for response in responses if response.status_code == 429)
+    assert rejected.json()["error"]["code"] == "RATE_LIMIT"
 
-def test_error_handling():
+def test_error_handling(client):
     """Test uniform error handling."""
     response = client.post("/api/login", json={
         "email": "invalid-email",
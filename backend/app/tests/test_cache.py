@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+from app.core.cache import SemanticQueryCache
+
+
+class FakeRedis:
+    """Shared key-value store standing in for Redis across cache instances."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+def unit_vector(*components: float) -> np.ndarray:
+    vector = np.zeros(4, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.mark.usefixtures("fake_time")
+class TestSemanticQueryCache:
+    def test_hit_above_threshold(self):
+        """Test a near-identical query returns the stored results."""
+        query_cache = SemanticQueryCache(dimension=4, threshold=0.95)
+        results = [{"resume_id": 1}]
+        query_cache.put(unit_vector(1.0), 3, results)
+        
+        assert query_cache.get(unit_vector(1.0, 0.1), 3) is results
+
+    def test_miss_below_threshold(self):
+        """Test a dissimilar query is not served from the cache."""
+        query_cache = SemanticQueryCache(dimension=4, threshold=0.95)
+        query_cache.put(unit_vector(1.0), 3, [{"resume_id": 1}])
+        
+        # Cosine similarity ~0.71
+        assert query_cache.get(unit_vector(1.0, 1.0), 3) is None
+
+    def test_miss_on_different_k(self):
+        """Test results are only reused for the same k."""
+        query_cache = SemanticQueryCache(dimension=4)
+        query_cache.put(unit_vector(1.0), 3, [{"resume_id": 1}])
+        
+        assert query_cache.get(unit_vector(1.0), 5) is None
+
+    def test_entries_expire(self, fake_time):
+        """Test entries are not returned after their TTL."""
+        query_cache = SemanticQueryCache(dimension=4, ttl_seconds=60)
+        query_cache.put(unit_vector(1.0), 3, [{"resume_id": 1}])
+        
+        fake_time.now += 59
+        assert query_cache.get(unit_vector(1.0), 3) is not None
+        fake_time.now += 1
+        assert query_cache.get(unit_vector(1.0), 3) is None
+
+    def test_evicts_least_recently_used(self, fake_time):
+        """Test a full cache evicts the entry used longest ago."""
+        query_cache = SemanticQueryCache(dimension=4, max_entries=2)
+        query_cache.put(unit_vector(1.0), 3, [{"resume_id": 1}])
+        fake_time.now += 1
+        query_cache.put(unit_vector(0.0, 1.0), 3, [{"resume_id": 2}])
+        fake_time.now += 1
+        
+        # Touch the first entry so the second becomes least recently used
+        assert query_cache.get(unit_vector(1.0), 3) is not None
+        fake_time.now += 1
+        query_cache.put(unit_vector(0.0, 0.0, 1.0), 3, [{"resume_id": 3}])
+        
+        assert query_cache.get(unit_vector(1.0), 3) is not None
+        assert query_cache.get(unit_vector(0.0, 1.0), 3) is None
+        assert query_cache.get(unit_vector(0.0, 0.0, 1.0), 3) is not None
+
+    def test_clear(self):
+        """Test clear() drops every entry."""
+        query_cache = SemanticQueryCache(dimension=4)
+        query_cache.put(unit_vector(1.0), 3, [{"resume_id": 1}])
+        
+        query_cache.clear()
+        
+        assert query_cache.get(unit_vector(1.0), 3) is None
+
+    def test_clear_reaches_other_processes(self):
+        """Test clear() in one instance invalidates another sharing the same Redis."""
+        redis = FakeRedis()
+        this_worker = SemanticQueryCache(dimension=4, redis_client=redis)
+        other_worker = SemanticQueryCache(dimension=4, redis_client=redis)
+        other_worker.put(unit_vector(1.0), 3, [{"resume_id": 1}])
+        
+        this_worker.clear()
+        
+        assert other_worker.get(unit_vector(1.0), 3) is None
+        # Entries stored after the clear are served again
+        other_worker.put(unit_vector(1.0), 3, [{"resume_id": 2}])
+        assert other_worker.get(unit_vector(1.0), 3) == [{"resume_id": 2}]
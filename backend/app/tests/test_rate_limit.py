@@ -0,0 +1,142 @@
+import pytest
+from unittest.mock import MagicMock
+from app.core.rate_limit import SlidingWindowRateLimiter
+
+
+class FakeRedis:
+    """Minimal sorted-set Redis supporting the commands the limiter uses."""
+
+    def __init__(self):
+        self.sorted_sets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def zrem(self, key, member):
+        return int(self.sorted_sets.get(key, {}).pop(member, None) is not None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def zremrangebyscore(self, key, min_score, max_score):
+        self.commands.append(("zremrangebyscore", key, min_score, max_score))
+
+    def zadd(self, key, mapping):
+        self.commands.append(("zadd", key, mapping))
+
+    def zcard(self, key):
+        self.commands.append(("zcard", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def execute(self):
+        results = []
+        for command, key, *args in self.commands:
+            members = self.redis.sorted_sets.setdefault(key, {})
+            if command == "zremrangebyscore":
+                expired = [m for m, score in members.items() if args[0] <= score <= args[1]]
+                for member in expired:
+                    del members[member]
+                results.append(len(expired))
+            elif command == "zadd":
+                members.update(args[0])
+                results.append(len(args[0]))
+            elif command == "zcard":
+                results.append(len(members))
+            else:
+                results.append(True)
+        return results
+
+
+@pytest.mark.usefixtures("fake_time")
+class TestSlidingWindowRateLimiter:
+    def test_blocks_after_limit(self):
+        """Test the request after the limit is rejected within one window."""
+        limiter = SlidingWindowRateLimiter(None, limit=60, window_seconds=60)
+        
+        results = [limiter.allow("user") for _ in range(61)]
+        
+        assert all(results[:60])
+        assert results[60] is False
+
+    def test_window_slides(self, fake_time):
+        """Test requests are allowed again once old ones leave the window."""
+        limiter = SlidingWindowRateLimiter(None, limit=2, window_seconds=60)
+        
+        assert limiter.allow("user")
+        fake_time.now += 30
+        assert limiter.allow("user")
+        assert not limiter.allow("user")
+        
+        # The first request has expired, the second is still in the window
+        fake_time.now += 30
+        assert limiter.allow("user")
+        assert not limiter.allow("user")
+
+    def test_users_are_limited_independently(self):
+        """Test one user's requests don't count against another's."""
+        limiter = SlidingWindowRateLimiter(None, limit=1, window_seconds=60)
+        
+        assert limiter.allow("alice")
+        assert not limiter.allow("alice")
+        assert limiter.allow("bob")
+
+    def test_evicts_least_recently_seen_user(self):
+        """Test the local store stays bounded by max_local_users."""
+        limiter = SlidingWindowRateLimiter(None, limit=1, window_seconds=60, max_local_users=2)
+        
+        limiter.allow("alice")
+        limiter.allow("bob")
+        limiter.allow("alice")
+        limiter.allow("carol")
+        
+        assert list(limiter._local_windows) == ["alice", "carol"]
+
+    def test_redis_blocks_after_limit(self):
+        """Test the Redis path rejects the request after the limit."""
+        redis = FakeRedis()
+        limiter = SlidingWindowRateLimiter(redis, limit=3, window_seconds=60)
+        
+        results = [limiter.allow("user") for _ in range(4)]
+        
+        assert results == [True, True, True, False]
+        assert len(redis.sorted_sets["rl:user"]) == 3
+
+    def test_redis_rejections_do_not_extend_lockout(self, fake_time):
+        """Test rejected requests aren't recorded, so a client over the limit recovers."""
+        redis = FakeRedis()
+        limiter = SlidingWindowRateLimiter(redis, limit=2, window_seconds=60)
+        
+        assert limiter.allow("user")
+        assert limiter.allow("user")
+        
+        # Keep hammering while limited
+        for _ in range(10):
+            fake_time.now += 5
+            assert not limiter.allow("user")
+        
+        # Once the two accepted requests age out, requests are allowed again
+        fake_time.now += 15
+        assert limiter.allow("user")
+
+    def test_redis_error_falls_back_to_local(self):
+        """Test a failing Redis client falls back to the in-process window."""
+        redis = FakeRedis()
+        redis.pipeline = MagicMock(side_effect=ConnectionError)
+        limiter = SlidingWindowRateLimiter(redis, limit=1, window_seconds=60)
+        
+        assert limiter.allow("user")
+        assert not limiter.allow("user")
+        assert "user" in limiter._local_windows
+
+    @pytest.mark.asyncio
+    async def test_allow_async_uses_redis(self):
+        """Test allow_async applies the same Redis-backed limit."""
+        limiter = SlidingWindowRateLimiter(FakeRedis(), limit=1, window_seconds=60)
+        
+        assert await limiter.allow_async("user")
+        assert not await limiter.allow_async("user")
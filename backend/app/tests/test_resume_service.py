@@ -1,21 +1,68 @@
+import io
+import zipfile
 import pytest
+import numpy as np
+import spacy
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import patch, MagicMock
-from app.services.resume_service import ResumeProcessingService
+from app.models.models import Resume, User
+from app.services import resume_service as resume_service_module
+from app.services.resume_service import ResumeProcessingService, resume_service
+
+
+class InlineExecutor:
+    """Process pool stand-in that runs submitted work in the calling process."""
+
+    def __init__(self, max_workers=None, mp_context=None):
+        pass
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class BrokenExecutor(InlineExecutor):
+    """Process pool whose worker process has died."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+        return future
 
 
 class TestResumeProcessingService:
-    def setup_method(self):
-        self.service = ResumeProcessingService()
+    @pytest.fixture(scope="class", autouse=True)
+    def service(self, request):
+        # Shared by every test in the class; no embedding or spaCy model is loaded
+        request.cls.service = ResumeProcessingService(with_embedding_model=False)
 
     def test_redact_pii_with_spacy(self):
         """Test PII redaction with spaCy model."""
-        text = "John Doe's email is john.doe@example.com and phone is 555-123-4567"
-        result = self.service.redact_pii(text)
-        
-        # Should redact email and phone
-        assert "[REDACTED]" in result
-        assert "john.doe@example.com" not in result
-        assert "555-123-4567" not in result
+        # Blank pipeline with a rule-based NER, so no trained model is needed
+        nlp = spacy.blank("en")
+        ruler = nlp.add_pipe("entity_ruler")
+        ruler.add_patterns([
+            {"label": "PERSON", "pattern": "John Doe"},
+            {"label": "PERSON", "pattern": "Agent 555-123-4567"},
+        ])
+        with patch.object(self.service, 'nlp', nlp):
+            text = (
+                "John Doe's email is john.doe@example.com. "
+                "Ask John Doe or call Agent 555-123-4567 now."
+            )
+            result = self.service.redact_pii(text)
+            
+            # Every mention of the name is redacted, and the PERSON span that
+            # overlaps the phone number collapses into a single marker
+            assert result == (
+                "[REDACTED]'s email is [REDACTED]. "
+                "Ask [REDACTED] or call [REDACTED] now."
+            )
 
     def test_redact_pii_fallback(self):
         """Test PII redaction fallback when spaCy is not available."""
@@ -31,12 +78,14 @@ class TestResumeProcessingService:
     def test_generate_embedding(self):
         """Test embedding generation."""
         text = "This is a test resume with Python and FastAPI experience"
-        embedding = self.service.generate_embedding(text)
+        # Uses the real model already loaded by the module-level service
+        embedding = resume_service.generate_embedding(text)
         
-        # Should return a list of floats
-        assert isinstance(embedding, list)
-        assert len(embedding) == 384  # all-MiniLM-L6-v2 dimension
-        assert all(isinstance(x, float) for x in embedding)
+        # Should return a normalized float32 vector
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.dtype == np.float32
+        assert embedding.shape == (384,)  # all-MiniLM-L6-v2 dimension
+        assert np.linalg.norm(embedding) == pytest.approx(1.0, abs=1e-5)
 
     def test_extract_requirements(self):
         """Test requirement extraction from job description."""
@@ -65,12 +114,68 @@ class TestResumeProcessingService:
         resume_content = "I have 5 years of Python experience and worked with FastAPI for 2 years."
         job_description = "Looking for Python developer with FastAPI experience"
         
-        evidence = self.service._extract_evidence(resume_content, job_description)
+        job_keywords = frozenset(self.service._extract_keywords(job_description))
+        
+        evidence = self.service._extract_evidence(resume_content, job_keywords)
         
         # Should extract relevant sentences
         assert "Python" in evidence
         assert "FastAPI" in evidence
 
+    def test_analyze_missing_requirements(self):
+        """Test that requirements without matching evidence are reported."""
+        job_desc = """
+        Required skills: Python and FastAPI
+        Kubernetes skills required
+        """
+        evidence_texts = ["Built Python services with FastAPI"]
+        
+        job_requirements = self.service._extract_requirements(job_desc)
+        
+        missing = self.service._analyze_missing_requirements(job_requirements, evidence_texts)
+        
+        assert missing == ["Kubernetes skills required"]
+
+    @patch('app.services.resume_service.EMBEDDING_BACKFILL_BATCH_SIZE', 2)
+    def test_embed_pending_resumes(self, db_session):
+        """Test resumes without an embedding are embedded in batches."""
+        user = User(email="owner@example.com", hashed_password="x", role="recruiter")
+        db_session.add(user)
+        db_session.flush()
+        
+        embedded_vector = np.full(384, 0.5, dtype=np.float32)
+        pending = [
+            Resume(filename=f"resume{i}.pdf", content_text="text", pii_redacted_content=f"Resume {i}", owner_id=user.id)
+            for i in range(3)
+        ]
+        already_embedded = Resume(
+            filename="done.pdf",
+            content_text="text",
+            pii_redacted_content="Done",
+            owner_id=user.id,
+            embedding=embedded_vector
+        )
+        db_session.add_all(pending + [already_embedded])
+        db_session.commit()
+        
+        # Encoder stub returning one distinct vector per text
+        model = MagicMock()
+        model.tokenizer.side_effect = lambda texts, **kwargs: {"input_ids": [[0] * len(text) for text in texts]}
+        model.encode.side_effect = lambda texts, **kwargs: np.stack(
+            [np.full(384, float(text.split()[-1]), dtype=np.float32) for text in texts]
+        )
+        
+        with patch.object(self.service, 'embedding_model', model):
+            embedded = self.service.embed_pending_resumes(db_session)
+        
+        assert embedded == 3
+        # Three pending rows at two per batch, then an empty batch
+        assert model.encode.call_count == 2
+        db_session.expire_all()
+        for i, resume in enumerate(pending):
+            assert np.allclose(resume.embedding, i)
+        assert np.allclose(already_embedded.embedding, embedded_vector)
+
     @patch('app.services.resume_service.io.BytesIO')
     @patch('app.services.resume_service.pypdf.PdfReader')
     def test_extract_text_from_pdf(self, mock_pdf_reader, mock_bytes_io):
@@ -103,3 +208,40 @@ class TestResumeProcessingService:
         """Test error handling for unsupported file types."""
         with pytest.raises(ValueError, match="Unsupported file type"):
             self.service.extract_text_from_file("test.txt", b"content")
+
+    def test_iter_zip_file_skips_unreadable_members(self):
+        """Test a corrupt member is skipped without dropping the members after it."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_file:
+            zip_file.writestr("a.docx", b"resume a")
+            zip_file.writestr("b.docx", b"resume b")
+            zip_file.writestr("notes.txt", b"not a resume")
+            zip_file.writestr("c.docx", b"resume c")
+        
+        # Flip a byte of b.docx so reading it fails its CRC check
+        archive = bytearray(buffer.getvalue())
+        archive[archive.index(b"resume b")] ^= 0xFF
+        
+        members = list(self.service.iter_zip_file(io.BytesIO(bytes(archive))))
+        
+        assert members == [("a.docx", b"resume a"), ("c.docx", b"resume c")]
+
+    def test_extract_and_redact_many_replaces_broken_pool(self, monkeypatch):
+        """Test a dead extraction worker skips its files and the next call gets a new pool."""
+        monkeypatch.setattr(resume_service_module, "ProcessPoolExecutor", InlineExecutor)
+        monkeypatch.setattr(resume_service_module, "_extraction_pool", BrokenExecutor())
+        monkeypatch.setattr(resume_service_module, "_worker_service", None)
+        monkeypatch.setattr(
+            ResumeProcessingService, "extract_text_from_file", lambda self, filename, file_content: file_content.decode()
+        )
+        files = [("a.docx", b"resume a"), ("b.docx", b"resume b")]
+        
+        # The upload skips the files in flight instead of failing
+        assert self.service.extract_and_redact_many(files) == []
+        assert resume_service_module._extraction_pool is None
+        
+        assert self.service.extract_and_redact_many(files) == [
+            ("a.docx", "resume a", "resume a"),
+            ("b.docx", "resume b", "resume b"),
+        ]
+        assert isinstance(resume_service_module._extraction_pool, InlineExecutor)
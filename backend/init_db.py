@@ -24,32 +24,34 @@ def init_db():
     db = SessionLocal()
     
     try:
+        test_users = [
+            ("recruiter@example.com", UserRole.RECRUITER),
+            ("candidate@example.com", UserRole.CANDIDATE),
+        ]
         
-        # Check if users already exist
-        existing_recruiter = db.query(User).filter(User.email == "recruiter@example.com").first()
-        existing_candidate = db.query(User).filter(User.email == "candidate@example.com").first()
-        
-        if not existing_recruiter:
-            recruiter = User(
-                email="recruiter@example.com",
-                hashed_password=get_password_hash("strongpassword"),
-                role=UserRole.RECRUITER
+        # Check which users already exist in one query
+        existing_emails = {
+            email for (email,) in db.query(User.email).filter(
+                User.email.in_([email for email, _ in test_users])
             )
-            db.add(recruiter)
-            print("✅ Test recruiter user created")
-        else:
-            print("ℹ️  Test recruiter user already exists")
+        }
+        
+        # Only hash passwords for users that are actually created
+        new_users = []
+        for email, role in test_users:
+            if email in existing_emails:
+                print(f"ℹ️  Test {role.value} user already exists")
+                continue
             
-        if not existing_candidate:
-            candidate = User(
-                email="candidate@example.com",
+            new_users.append(User(
+                email=email,
                 hashed_password=get_password_hash("strongpassword"),
-                role=UserRole.CANDIDATE
-            )
-            db.add(candidate)
-            print("✅ Test candidate user created")
-        else:
-            print("ℹ️  Test candidate user already exists")
+                role=role
+            ))
+            print(f"✅ Test {role.value} user created")
+        
+        if new_users:
+            db.bulk_save_objects(new_users)
         
         db.commit()
         print("🎉 Database initialization completed successfully!")